@@ -1,9 +1,9 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-import os
 import logging
 
 from api.v1 import router as api_v1_router
+from services.video_service import aclose as close_video_service, sweep_temp_dir
 
 
 # 配置日志
@@ -13,9 +13,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 创建临时目录
-os.makedirs("./temp", exist_ok=True)
-
 app = FastAPI(
     title="Video Download Service",
     version="1.0.0",
@@ -70,7 +67,7 @@ async def root():
             }
         }
     except Exception as e:
-        logger.error(f"Root endpoint error: {e}")
+        logger.error("Root endpoint error: %s", e)
         return {
             "message": "Video Download Service is running (with errors)",
             "version": "4.0.0",
@@ -84,6 +81,13 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.on_event("shutdown")
+async def cleanup_on_shutdown():
+    """关闭时释放HTTP连接并清理本进程的临时下载目录"""
+    await close_video_service()
+    sweep_temp_dir()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1,6 +1,10 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any, Union
 from enum import Enum
+import math
+
+# 精确类型匹配的数值类型（type(v) in _NUMTYPES 不会把bool当作int）
+_NUMTYPES = (int, float)
 
 
 class Platform(str, Enum):
@@ -30,7 +34,7 @@ class VideoInfo(BaseModel):
     view_count: Optional[int] = None
     formats: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None  # 支持字典和列表格式
     
-    @field_validator('duration', 'view_count')
+    @field_validator('duration', 'view_count', mode='before')
     @classmethod
     def validate_numeric_fields(cls, v):
         """验证数值字段，将浮点数转换为整数，处理各种数值类型"""
@@ -38,8 +42,8 @@ class VideoInfo(BaseModel):
             return None
         try:
             # 如果是数字类型，转换为整数
-            if isinstance(v, (int, float)):
-                if str(v).lower() in ['nan', 'inf', '-inf']:
+            if type(v) in _NUMTYPES:
+                if type(v) is float and not math.isfinite(v):
                     return None
                 return int(float(v))
             # 如果是字符串，尝试转换
@@ -69,15 +73,25 @@ class CreatorInfo(BaseModel):
     follower_count: Optional[int] = None
     video_count: Optional[int] = None
     
-    @field_validator('follower_count', 'video_count')
+    @field_validator('follower_count', 'video_count', mode='before')
     @classmethod
     def validate_counts(cls, v):
         """验证数量字段，将浮点数转换为整数"""
         if v is None:
             return None
-        if isinstance(v, (int, float)):
-            return int(v)  # 将浮点数转换为整数
-        return None
+        try:
+            # 如果是数字类型，将浮点数转换为整数
+            if type(v) in _NUMTYPES:
+                if type(v) is float and not math.isfinite(v):
+                    return None
+                return int(v)
+            # 如果是字符串，尝试转换
+            elif isinstance(v, str) and v.strip().isdigit():
+                return int(v.strip())
+            else:
+                return None
+        except (ValueError, TypeError, OverflowError):
+            return None
 
 
 class CreatorVideoItem(BaseModel):
@@ -91,7 +105,7 @@ class CreatorVideoItem(BaseModel):
     bv_id: Optional[str] = None  # B站特有
     description: Optional[str] = None  # 视频描述
     
-    @field_validator('duration', 'view_count')
+    @field_validator('duration', 'view_count', mode='before')
     @classmethod
     def validate_numeric_fields(cls, v):
         """验证数值字段，将浮点数转换为整数，处理各种数值类型"""
@@ -99,8 +113,8 @@ class CreatorVideoItem(BaseModel):
             return None
         try:
             # 如果是数字类型，转换为整数
-            if isinstance(v, (int, float)):
-                if str(v).lower() in ['nan', 'inf', '-inf']:
+            if type(v) in _NUMTYPES:
+                if type(v) is float and not math.isfinite(v):
                     return None
                 return int(float(v))
             # 如果是字符串，尝试转换
@@ -4,42 +4,197 @@
 """
 
 import asyncio
+import atexit
+import re
 import subprocess
 import json
+import time
 import os
-import tempfile
 import logging
+import sys
 import base64
 import shutil
-from typing import Optional, Dict, Any, List
-from concurrent.futures import ThreadPoolExecutor
+import functools
+import contextlib
+import itertools
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Iterator, Callable, Awaitable
+
+import aiofiles
+import aiohttp
+from cachetools import TTLCache
+
+# orjson为可选依赖，安装后解析yt-dlp的大段JSON更快
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as _async_timeout
+else:
+    # Python 3.11之前没有asyncio.timeout，使用同接口的async_timeout
+    from async_timeout import timeout as _async_timeout
 
 from models import Platform, VideoQuality, CreatorInfo, CreatorVideoItem, CreatorVideosResponse
 
 logger = logging.getLogger(__name__)
 
 # 配置常量
-TEMP_DIR = "./temp"
+# 导入时解析为绝对路径，传给yt-dlp和文件操作时无需再相对当前目录解析
+TEMP_DIR = os.path.abspath("./temp")
+# 可选：下载中间文件（分片、合并前的音视频）放到单独的高速盘目录，最终文件仍输出到TEMP_DIR
+SCRATCH_DIR = os.path.abspath(os.environ["VIDEO_SCRATCH_DIR"]) if os.environ.get("VIDEO_SCRATCH_DIR") else None
 DOWNLOAD_TIMEOUT = 300
+INFO_TIMEOUT = 60
+PLAYLIST_TIMEOUT = 90
+# yt-dlp进程数上限：按CPU核数确定（进程大多在等网络，每核2个），可用环境变量覆盖（至少为1）
+MAX_CONCURRENT_YTDLP = min(8, 2 * (os.cpu_count() or 1))
+if os.environ.get("MAX_CONCURRENT_YTDLP"):
+    try:
+        MAX_CONCURRENT_YTDLP = max(1, int(os.environ["MAX_CONCURRENT_YTDLP"]))
+    except ValueError:
+        logger.warning(
+            "MAX_CONCURRENT_YTDLP=%r 不是整数，使用默认值 %d",
+            os.environ["MAX_CONCURRENT_YTDLP"], MAX_CONCURRENT_YTDLP
+        )
+COOKIE_FILE = "./cookies.txt"
+REQUIRED_TOOLS = ('yt-dlp', 'ffmpeg', 'ffprobe')
+CONCURRENT_FRAGMENTS = 4  # 未单独配置的平台使用的分片并发数
+HTTP_CHUNK_SIZE = "10M"
+DIRECT_CHUNK_SIZE = 1 << 20  # 直连下载每次读取1MB
+INFO_JSON_NAME = "info.json"
+MAX_HTTP_CONNECTIONS = 32
+HTTP_CONNECT_TIMEOUT = 10  # 秒
+HTTP_READ_TIMEOUT = 30  # 单次读取的超时（秒），整体下载时长由DOWNLOAD_TIMEOUT限制
+DNS_CACHE_TTL = 300  # 秒
+PLAYLIST_LINE_LIMIT = 1 << 20  # 逐行读取时单行JSON的上限（含大量缩略图的条目也能容纳）
+METADATA_CACHE_SIZE = 1024
+METADATA_CACHE_TTL = 3600  # 秒
+NEGATIVE_CACHE_TTL = 300  # 确定性错误的缓存时间（秒）
+FORMAT_EXPIRE_MARGIN = 60  # 直链剩余有效期不足该秒数时视为过期
+
+# 可直接用HTTP GET下载的格式协议（m3u8/dash等分片协议仍交给yt-dlp）
+_DIRECT_PROTOCOLS = frozenset({'http', 'https'})
+
+# 可下载的live_status取值（直播/预告等均不支持）
+_NOT_LIVE_STATUSES = (None, 'not_live')
 
 # 支持的媒体文件扩展名
-AUDIO_EXTENSIONS = ['.mp3', '.m4a', '.aac', '.ogg', '.opus', '.wav', '.flac']
-VIDEO_EXTENSIONS = ['.mp4', '.webm', '.mkv', '.m4v', '.flv', '.avi', '.mov']
-ALL_MEDIA_EXTENSIONS = AUDIO_EXTENSIONS + VIDEO_EXTENSIONS
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.m4a', '.aac', '.ogg', '.opus', '.wav', '.flac'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.webm', '.mkv', '.m4v', '.flv', '.avi', '.mov'})
+ALL_MEDIA_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
+
+# 输入中需要忽略的制表符和换行
+_STRIP_TABLE = str.maketrans('', '', '\t\n\r')
+
+# 以下正则预编译后直接绑定匹配方法，调用时省去一次属性查找
+# base64结构：至少8个字符、长度为4的倍数、'='只能作为末尾填充
+_match_base64 = re.compile(
+    r'(?=.{8})(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?'
+).fullmatch
+# 解码后内容的URL特征
+_search_url_feature = re.compile(r'https?://|\.(?:co|tv|net|org)', re.IGNORECASE).search
+
+# 媒体直链中的过期时间戳：YouTube的expire=、TikTok的x-expires=、B站的deadline=
+_search_url_expire = re.compile(r'[?&/](?:x-)?(?:expires?|deadline)[=/](\d{9,})').search
+
+# yt-dlp确定性错误（私有、下架等），重试或更换格式都无法恢复
+_search_definitive_error = re.compile(
+    r'Private video|This video is private|Video unavailable|This video has been removed'
+).search
+
+# 平台URL特征（分组名即Platform取值，一次扫描完成识别）
+_search_platform_url = re.compile(
+    r'(?P<bilibili>bilibili\.com|b23\.tv)'
+    r'|(?P<youtube>youtube\.com|youtu\.be)'
+    r'|(?P<tiktok>tiktok\.com)',
+    re.IGNORECASE
+).search
+
+# 平台域名表：按host后缀直接查表，未命中时再回退到正则扫描
+_HOST_PLATFORMS: Dict[str, Platform] = {
+    'bilibili.com': Platform.BILIBILI,
+    'b23.tv': Platform.BILIBILI,
+    'youtube.com': Platform.YOUTUBE,
+    'youtu.be': Platform.YOUTUBE,
+    'tiktok.com': Platform.TIKTOK,
+}
+
+# yt-dlp固定参数，每次调用只追加可变部分
+_YTDLP_INFO_ARGS = ('yt-dlp', '--dump-json', '--format-sort=resolution,ext,tbr')
+_YTDLP_DOWNLOAD_ARGS = (
+    'yt-dlp',
+    '-o', '%(title).50s.%(ext)s',
+    '--print', 'after_move:filepath',
+    '--no-warnings',
+    '--no-progress',  # stderr只保留错误信息
+    '--http-chunk-size', HTTP_CHUNK_SIZE,  # HTTP分块请求避免单连接被限速
+)
+# HLS/DASH分片并发数按平台区分：TikTok风控较严，保持较低并发
+_PLATFORM_FRAGMENTS = {
+    Platform.TIKTOK: 2,
+    Platform.BILIBILI: 4,
+    Platform.YOUTUBE: 8,
+}
+_FRAGMENT_ARGS = {
+    platform: ('--concurrent-fragments', str(_PLATFORM_FRAGMENTS.get(platform, CONCURRENT_FRAGMENTS)))
+    for platform in Platform
+}
+# 创作者列表：不再输出整个-J大文档，而是每个条目一行只含所需字段的JSON，
+# 最后再输出一行播放列表自身信息（带_type=playlist，用于区分）
+_YTDLP_PLAYLIST_ARGS = (
+    'yt-dlp', '--flat-playlist',
+    '--lazy-playlist',  # 边获取边处理条目，配合-I在取够数量后即可停止翻页
+    '--print', '%(.{id,url,webpage_url,title,duration,view_count,thumbnails,timestamp,upload_date})j',
+    '--print', 'playlist:%(.{_type,channel,uploader,title,description,thumbnails,uploader_avatar,'
+               'channel_follower_count,playlist_count})j',
+)
+
+# 限制同时运行的yt-dlp进程数
+_YTDLP_SEM = asyncio.Semaphore(MAX_CONCURRENT_YTDLP)
+
+# yt-dlp输出字段类型可靠，默认跳过pydantic校验直接构造模型；排查数据问题时可关闭
+TRUSTED_YTDLP_OUTPUT = True
+if TRUSTED_YTDLP_OUTPUT:
+    _make_creator_info = CreatorInfo.model_construct
+    _make_video_item = CreatorVideoItem.model_construct
+    _make_videos_response = CreatorVideosResponse.model_construct
+else:
+    _make_creator_info = CreatorInfo
+    _make_video_item = CreatorVideoItem
+    _make_videos_response = CreatorVideosResponse
+
+
+def _build_response_templates(creator_name: str) -> Dict[Platform, CreatorVideosResponse]:
+    """按平台预建空结果/错误结果模板，按需复制，避免错误路径上重复模型校验"""
+    return {
+        platform: _make_videos_response(
+            creator_info=_make_creator_info(name=creator_name, platform=platform, profile_url=""),
+            videos=[],
+            total_count=0,
+            has_more=False
+        )
+        for platform in Platform
+    }
+
+
+_EMPTY_RESPONSE_TEMPLATES = _build_response_templates("未知创作者")
+_ERROR_RESPONSE_TEMPLATES = _build_response_templates("服务暂不可用")
 
 
 def validate_executables() -> bool:
     """验证必要的可执行文件是否存在"""
-    required_tools = ['yt-dlp', 'ffmpeg', 'ffprobe']
     missing_tools = []
     
-    for tool in required_tools:
+    for tool in REQUIRED_TOOLS:
         result = subprocess.run(['which', tool], capture_output=True, text=True)
         if result.returncode != 0:
             missing_tools.append(tool)
     
     if missing_tools:
-        logger.error(f"缺少必要工具: {', '.join(missing_tools)}")
+        logger.error("缺少必要工具: %s", ', '.join(missing_tools))
         return False
     
     logger.info("所有必要工具已安装")
@@ -55,119 +210,497 @@ def decode_base64_url(input_str: str) -> str:
             
         decoded_bytes = base64.b64decode(input_str)
         decoded_str = decoded_bytes.decode('utf-8')
-        logger.info(f"成功解码base64 URL: {decoded_str}")
+        logger.info("成功解码base64 URL: %s", decoded_str)
         return decoded_str
     except Exception as e:
-        logger.debug(f"base64解码失败: {e}")
+        logger.debug("base64解码失败: %s", e)
         return input_str
 
 
 def is_base64_encoded(input_str: str) -> bool:
     """检查字符串是否为base64编码"""
     try:
-        # 基本格式检查
-        if len(input_str) % 4 != 0 or len(input_str) < 8:
-            return False
-            
-        # 检查字符集
-        import string
-        base64_chars = string.ascii_letters + string.digits + '+/='
-        if not all(c in base64_chars for c in input_str):
+        # 格式检查（长度和字符集由同一个正则约束）
+        if not _match_base64(input_str):
             return False
             
         # 尝试解码
         decoded = base64.b64decode(input_str, validate=True).decode('utf-8')
         
         # 检查解码后的内容是否包含URL特征
-        url_patterns = ['http://', 'https://', '.com', '.tv', '.net', '.org', '.co']
-        return any(pattern in decoded.lower() for pattern in url_patterns)
+        return bool(_search_url_feature(decoded))
         
     except Exception:
         return False
 
 
-def ensure_temp_dir() -> str:
-    """确保临时目录存在"""
-    if not os.path.exists(TEMP_DIR):
-        os.makedirs(TEMP_DIR, exist_ok=True)
-    return TEMP_DIR
+# 临时目录在导入时创建一次；每个任务用"进程号-序号"的子目录，免去mkdtemp的随机名重试
+os.makedirs(TEMP_DIR, exist_ok=True)
+_job_counter = itertools.count()
+
+
+def _make_job_dir() -> str:
+    """为单次下载创建独立的临时子目录"""
+    while True:
+        path = os.path.join(TEMP_DIR, f"{os.getpid()}-{next(_job_counter)}")
+        try:
+            os.mkdir(path)
+            return path
+        except FileExistsError:
+            # 进程号复用时可能撞上残留目录，换下一个序号
+            continue
+        except FileNotFoundError:
+            # 临时根目录在运行中被删除
+            os.makedirs(TEMP_DIR, exist_ok=True)
+
+
+def _fast_rmtree(path: str):
+    """删除任务目录：目录是平铺的少量文件，scandir+unlink后rmdir；有子目录时交给rmtree"""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
 
 
 def cleanup_temp_files(temp_dir: str):
     """清理临时文件"""
     try:
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
-            logger.debug(f"清理临时目录: {temp_dir}")
+        _fast_rmtree(temp_dir)
+        logger.debug("清理临时目录: %s", temp_dir)
+    except FileNotFoundError:
+        pass
     except Exception as e:
-        logger.warning(f"清理临时目录失败: {e}")
+        logger.warning("清理临时目录失败: %s", e)
+
+
+def schedule_cleanup(temp_dir: str):
+    """在后台线程中清理临时目录，不阻塞事件循环"""
+    asyncio.get_running_loop().run_in_executor(None, cleanup_temp_files, temp_dir)
+
+
+def _scratch_dir_for(temp_dir: str) -> Optional[str]:
+    """任务在SCRATCH_DIR下对应的中间文件目录（与任务目录同名），未配置时返回None"""
+    if SCRATCH_DIR is None:
+        return None
+    return os.path.join(SCRATCH_DIR, os.path.basename(temp_dir))
+
+
+def sweep_temp_dir():
+    """清理本进程遗留的所有任务目录（只删"本进程号-"前缀的，不影响其他worker）"""
+    prefix = f"{os.getpid()}-"
+    for root in (TEMP_DIR, SCRATCH_DIR):
+        if root is None:
+            continue
+        try:
+            names = os.listdir(root)
+        except FileNotFoundError:
+            continue
+        for name in names:
+            if name.startswith(prefix):
+                cleanup_temp_files(os.path.join(root, name))
+
+
+# 进程退出时兜底清理（正常关闭时main.py的shutdown钩子会先执行一次）
+atexit.register(sweep_temp_dir)
+
+
+def _host_of(url: str) -> str:
+    """用字符串切片提取URL的host（不构造urlparse结果对象）"""
+    start = url.find('://')
+    if start < 0:
+        return ''
+    start += 3
+    end = url.find('/', start)
+    host = url[start:end] if end >= 0 else url[start:]
+    # 去掉查询串、用户信息和端口
+    return host.partition('?')[0].rpartition('@')[2].partition(':')[0].lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def detect_platform(url: str) -> Platform:
     """检测视频平台"""
-    url_lower = url.lower()
+    # 按域名标签逐级去掉最左一段，用字典查找匹配已知后缀（m.bilibili.com -> bilibili.com）
+    host = _host_of(url)
+    if host:
+        while host:
+            platform = _HOST_PLATFORMS.get(host)
+            if platform is not None:
+                return platform
+            host = host.partition('.')[2]
+        return Platform.UNKNOWN
     
-    if any(pattern in url_lower for pattern in ['bilibili.com', 'b23.tv']):
-        return Platform.BILIBILI
-    elif any(pattern in url_lower for pattern in ['youtube.com', 'youtu.be']):
-        return Platform.YOUTUBE
-    elif any(pattern in url_lower for pattern in ['tiktok.com']):
-        return Platform.TIKTOK
+    # 没有scheme的非标准输入（如bilibili.com/video/...）才回退到全文扫描
+    match = _search_platform_url(url)
+    if match:
+        return Platform(match.lastgroup)
     
     return Platform.UNKNOWN
 
 
+@functools.lru_cache(maxsize=4096)
+def normalize_input(input_str: str) -> str:
+    """标准化输入（纯函数，按输入缓存，结果字符串驻留以便重复请求共享）"""
+    # 去掉制表符和换行（如按76列换行的base64），再去首尾空白
+    input_str = input_str.translate(_STRIP_TABLE).strip()
+    
+    # 完整URL直接返回（base64字符集不含':'，无需再做解码判断）
+    # 先比较首字符，base64输入（通常以'a'开头）无需再走前缀元组匹配
+    if input_str[:1] == 'h' and input_str.startswith(('http://', 'https://')):
+        return sys.intern(input_str)
+    
+    # 尝试base64解码
+    decoded_input = decode_base64_url(input_str)
+    if decoded_input != input_str:
+        logger.info("检测到base64编码，已解码")
+        return sys.intern(decoded_input)
+    
+    # 如果不是base64，直接返回（假设是完整URL）
+    return sys.intern(input_str)
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """数值字段转整数，非数值、无法解析的字符串及NaN/Inf返回None（与模型校验规则一致）"""
+    # type() is 精确比较比isinstance更快，同时排除bool（JSON中的true/false不是数值）
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is float:
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
+            return None
+    if value_type is str:
+        # 部分平台以字符串返回计数（如"12345"），与模型校验一样只接受纯数字
+        value = value.strip()
+        if not value.isdigit():
+            return None
+        try:
+            return int(value)
+        except ValueError:  # isdigit也接受上标等int无法解析的数字字符
+            return None
+    return None
+
+
+def _first_thumb(entry: Dict[str, Any]) -> Optional[str]:
+    """选择缩略图 - 优先高度不低于120的，否则取第一张"""
+    thumbnails = entry.get("thumbnails")
+    if not thumbnails:
+        return None
+    return next(
+        (thumb.get("url") for thumb in thumbnails if (thumb.get("height") or 0) >= 120),
+        thumbnails[0].get("url")
+    )
+
+
+def _info_expired(info: Dict[str, Any]) -> bool:
+    """格式直链中带有过期时间戳（expire/deadline等参数）且即将过期时返回True"""
+    deadline = time.time() + FORMAT_EXPIRE_MARGIN
+    for fmt in info.get('formats') or ():
+        match = _search_url_expire(fmt.get('url') or '')
+        if match and int(match.group(1)) <= deadline:
+            return True
+    return False
+
+
+def _creator_avatar(info: Dict[str, Any]) -> Optional[str]:
+    """频道头像 - 取yt-dlp标记为avatar的频道缩略图"""
+    for thumb in info.get("thumbnails") or ():
+        if "avatar" in (thumb.get("id") or ""):
+            return thumb.get("url")
+    return info.get("uploader_avatar")
+
+
+def _as_upload_date(entry: Dict[str, Any]) -> Optional[str]:
+    """上传日期（YYYYMMDD），缺失时由timestamp推算"""
+    upload_date = entry.get("upload_date")
+    if upload_date:
+        return upload_date
+    timestamp = _as_int(entry.get("timestamp"))
+    if timestamp is None:
+        return None
+    try:
+        return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y%m%d")
+    except (ValueError, OverflowError, OSError):
+        # 超出范围的时间戳（如毫秒级）只丢弃日期字段，不影响整个条目
+        return None
+
+
+def _iter_entries(entries: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """展开播放列表条目（处理YouTube等嵌套结构）"""
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        if entry.get('_type') == 'playlist':
+            yield from (e for e in entry.get('entries') or [] if isinstance(e, dict))
+        else:
+            yield entry
+
+
+@contextlib.asynccontextmanager
+async def _ytdlp_process(cmd: List[str], timeout: float, **kwargs):
+    """启动yt-dlp子进程（受并发数限制），在超时范围内交给调用方读取输出；超时抛出subprocess.TimeoutExpired"""
+    async with _YTDLP_SEM:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **kwargs
+        )
+        try:
+            async with _async_timeout(timeout):
+                yield process
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout) from None
+        finally:
+            # 超时或调用被取消时终止子进程，避免遗留僵尸进程
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+
+async def _run_ytdlp(cmd: List[str], timeout: float) -> Tuple[int, bytes, bytes]:
+    """异步运行yt-dlp子进程并收集全部输出，不占用线程"""
+    async with _ytdlp_process(cmd, timeout) as process:
+        stdout, stderr = await process.communicate()
+    return process.returncode, stdout, stderr
+
+
+async def _extract_info(cmd: List[str]) -> Dict[str, Any]:
+    """运行yt-dlp获取视频信息"""
+    returncode, stdout, stderr = await _run_ytdlp(cmd, INFO_TIMEOUT)
+    if returncode != 0:
+        raise Exception(f"获取视频信息失败: {stderr.decode('utf-8', 'ignore')}")
+    # stdout保持bytes，直接交给json解析，省去一次解码
+    return _json_loads(stdout)
+
+
+def _scan_media_file(temp_dir: str) -> Optional[Tuple[str, int]]:
+    """单次scandir查找目录中的媒体文件，返回(路径, 大小)"""
+    with os.scandir(temp_dir) as it:
+        for entry in it:
+            name = entry.name
+            dot = name.rfind('.')
+            # 先用扩展名过滤（纯字符串操作），再确认是普通文件；不跟随符号链接
+            if dot > 0 and name[dot:].lower() in ALL_MEDIA_EXTENSIONS and entry.is_file(follow_symlinks=False):
+                return entry.path, entry.stat(follow_symlinks=False).st_size
+    return None
+
+
+async def _download(cmd: List[str], temp_dir: str) -> str:
+    """运行yt-dlp下载并返回文件路径"""
+    returncode, stdout, stderr = await _run_ytdlp(cmd, DOWNLOAD_TIMEOUT)
+    if returncode != 0:
+        raise Exception(f"下载失败: {stderr.decode('utf-8', 'ignore')}")
+    
+    # --print after_move:filepath 输出最终文件路径（最后一个非空行）
+    output = os.fsdecode(stdout).rstrip()
+    file_path = output[output.rfind('\n') + 1:]
+    
+    if not (file_path and os.path.isfile(file_path)):
+        # 兜底：扫描下载目录
+        logger.warning("未能从yt-dlp输出获取文件路径，改为扫描目录: %s", temp_dir)
+        found = _scan_media_file(temp_dir)
+        if found is None:
+            raise Exception("下载完成但未找到媒体文件")
+        file_path, file_size = found
+    else:
+        file_size = os.path.getsize(file_path)
+    
+    # 验证文件
+    if file_size == 0:
+        raise Exception("下载的文件无效或为空")
+    
+    logger.info("下载成功: %s (%d bytes)", os.path.basename(file_path), file_size)
+    return file_path
+
+
+def _write_info_json(info: Dict[str, Any], info_path: str):
+    """写出视频信息JSON（在线程中执行）"""
+    with open(info_path, 'w', encoding='utf-8') as f:
+        json.dump(info, f)
+
+
+async def _download_from_info(cmd: List[str], temp_dir: str, info: Dict[str, Any], info_path: str) -> str:
+    """把已获取的视频信息写入任务目录，再让yt-dlp通过--load-info-json下载，省去二次解析"""
+    await asyncio.to_thread(_write_info_json, info, info_path)
+    return await _download(cmd, temp_dir)
+
+
+def _parse_playlist_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """解析一行JSON输出，空行返回None"""
+    line = line.strip()
+    return _json_loads(line) if line else None
+
+
+async def _extract_playlist(cmd: List[str]) -> Optional[Dict[str, Any]]:
+    """运行yt-dlp获取播放列表信息，边读边解析逐行JSON（与-J结构相同），失败返回None"""
+    info: Dict[str, Any] = {}
+    entries: List[Dict[str, Any]] = []
+    async with _ytdlp_process(cmd, PLAYLIST_TIMEOUT, limit=PLAYLIST_LINE_LIMIT) as process:
+        # 并行读取stderr，避免管道写满阻塞子进程
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            async for line in process.stdout:
+                item = _parse_playlist_line(line)
+                if item is None:
+                    continue
+                if item.get('_type') == 'playlist':
+                    info = item
+                else:
+                    entries.append(item)
+            await process.wait()
+            stderr = await stderr_task
+        finally:
+            if not stderr_task.done():
+                stderr_task.cancel()
+    
+    if process.returncode != 0:
+        logger.error("命令失败: %s", stderr.decode('utf-8', 'ignore'))
+        return None
+    info['entries'] = entries
+    return info
+
+
 class VideoService:
     """视频服务主类 - 简化版本，专注于base64编码URL下载"""
     
     def __init__(self):
         # 验证依赖
         validate_executables()
+        
+        # cookie文件只在启动时检测一次（更新cookies.txt后需重启服务）
+        self._cookie_args: Tuple[str, ...] = ()
+        if os.path.exists(COOKIE_FILE):
+            self._cookie_args = ('--cookies', COOKIE_FILE)
+            logger.info("发现cookie文件，将使用cookies进行认证")
+        
+        # 元数据缓存：重复查询同一URL时不再启动yt-dlp子进程
+        self._info_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL)
+        self._creator_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=METADATA_CACHE_TTL)
+        # 确定性失败的URL短时间内直接返回错误，不再启动yt-dlp
+        self._error_cache = TTLCache(maxsize=METADATA_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL)
+        # 进行中的请求，同一key的并发调用共享一次执行（视频信息key为URL，创作者key为元组，互不冲突）
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        # 每个进行中的执行当前的等待者数量，全部离开时取消执行
+        self._inflight_waiters: Dict[asyncio.Future, int] = {}
+        # 后台预热任务（保留引用，防止任务被垃圾回收）
+        self._prewarm_tasks: set = set()
+        
+        # 直连下载共用的HTTP会话（需在事件循环中创建，首次使用时初始化）
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        
         logger.info("VideoService 初始化完成")
     
+    def prepare_input(self, url: str) -> Tuple[str, Platform]:
+        """标准化输入并检测平台，供端点层和服务内部共用一次结果"""
+        normalized_url = normalize_input(url)
+        platform = detect_platform(normalized_url)
+        logger.info("标准化URL: %s, 平台: %s", normalized_url, platform)
+        return normalized_url, platform
+    
     def normalize_input(self, input_str: str) -> str:
         """标准化输入 - 仅支持base64解码"""
-        input_str = input_str.strip()
+        return normalize_input(input_str)
+    
+    async def _singleflight(self, key: Any, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """同一key的并发调用只执行一次，所有调用方共享结果或异常"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = future
+            self._inflight_waiters[future] = 0
+            future.add_done_callback(functools.partial(self._singleflight_done, key))
+        self._inflight_waiters[future] += 1
+        try:
+            # shield：某个调用方被取消时不影响其他调用方共享的执行
+            return await asyncio.shield(future)
+        finally:
+            if not future.done():
+                self._inflight_waiters[future] -= 1
+                if self._inflight_waiters[future] == 0:
+                    # 所有调用方都已离开（如客户端断开），取消执行以终止yt-dlp子进程
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+                    future.cancel()
+    
+    def _singleflight_done(self, key: Any, future: asyncio.Future):
+        """共享执行结束：移出进行中表，并取出异常（调用方都已离开时避免"exception was never retrieved"）"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        self._inflight_waiters.pop(future, None)
+        if not future.cancelled():
+            future.exception()
+    
+    async def _get_cached(self, cache: TTLCache, key: Any,
+                          loader: Callable[[], Awaitable[Any]],
+                          should_cache: Callable[[Any], bool] = lambda value: True) -> Any:
+        """读取缓存，未命中时经singleflight加载"""
+        value = cache.get(key)
+        if value is not None:
+            return value
         
-        # 尝试base64解码
-        decoded_input = decode_base64_url(input_str)
-        if decoded_input != input_str:
-            logger.info(f"检测到base64编码，已解码")
-            return decoded_input
+        async def load():
+            value = await loader()
+            if should_cache(value):
+                cache[key] = value
+            return value
         
-        # 如果不是base64，直接返回（假设是完整URL）
-        return input_str
+        return await self._singleflight(key, load)
+    
+    def invalidate(self, url: str):
+        """清除某个URL的视频信息和创作者列表缓存，用于手动刷新"""
+        normalized_url = normalize_input(url)
+        self._info_cache.pop(normalized_url, None)
+        self._error_cache.pop(normalized_url, None)
+        for key in [key for key in self._creator_cache.keys() if key[0] == normalized_url]:
+            self._creator_cache.pop(key, None)
     
     async def get_video_info(self, url: str) -> Dict[str, Any]:
-        """获取视频信息"""
+        """获取视频信息（带TTL缓存，返回的dict为共享对象，调用方不应修改）"""
+        error = self._error_cache.get(url)
+        if error is not None:
+            raise Exception(error)
+        cached = self._info_cache.get(url)
+        if cached is not None and _info_expired(cached):
+            # 格式直链已过期，缓存的信息不能再用于下载
+            self._info_cache.pop(url, None)
         try:
-            cmd = [
-                'yt-dlp',
-                '--dump-json',
-                '--format-sort=resolution,ext,tbr',
-                url
-            ]
+            return await self._get_cached(self._info_cache, url, lambda: self._fetch_video_info(url))
+        except Exception as e:
+            if _search_definitive_error(str(e)):
+                self._error_cache[url] = str(e)
+            raise
+    
+    def prewarm(self, urls: Iterable[str]) -> asyncio.Task:
+        """后台预取一批URL的视频信息填充缓存（需在事件循环中调用），不阻塞调用方"""
+        task = asyncio.ensure_future(self._prewarm(list(urls)))
+        self._prewarm_tasks.add(task)
+        task.add_done_callback(self._prewarm_tasks.discard)
+        return task
+    
+    async def _prewarm(self, urls: List[str]):
+        """逐个获取视频信息（串行执行，只占用一个yt-dlp名额，不挤占用户请求）"""
+        for url in urls:
+            try:
+                normalized_url, _ = self.prepare_input(url)
+                await self.get_video_info(normalized_url)
+            except Exception as e:
+                logger.debug("预热失败 %s: %s", url, e)
+    
+    async def _fetch_video_info(self, url: str) -> Dict[str, Any]:
+        """调用yt-dlp获取视频信息"""
+        try:
+            cmd = [*_YTDLP_INFO_ARGS, url]
             
-            logger.info(f"获取视频信息: {url}")
+            logger.info("获取视频信息: %s", url)
             
-            def run_command():
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    encoding='utf-8'
-                )
-                if result.returncode != 0:
-                    raise Exception(f"获取视频信息失败: {result.stderr}")
-                return json.loads(result.stdout)
+            return await _extract_info(cmd)
             
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_command)
-                return await asyncio.wrap_future(future)
-                
         except Exception as e:
-            logger.error(f"获取视频信息失败: {e}")
+            logger.error("获取视频信息失败: %s", e)
             raise
     
     def select_best_format(self, video_info: Dict[str, Any]) -> str:
@@ -176,9 +709,14 @@ class VideoService:
         if not formats_data:
             return 'bestaudio/worst'
         
-        # 分类格式
-        audio_only_formats = []
-        video_formats = []
+        # 单次遍历完成分类，同时记录最佳音频和最低质量视频
+        best_audio = None
+        best_audio_tbr = 0
+        worst_video = None
+        worst_video_key = None
+        # 自带音轨的视频（progressive）无需ffmpeg合并，单独记录
+        worst_progressive = None
+        worst_progressive_key = None
         
         for fmt in formats_data:
             vcodec = fmt.get('vcodec', '')
@@ -188,171 +726,234 @@ class VideoService:
             has_audio = acodec and acodec != 'none'
             
             if has_audio and not has_video:
-                audio_only_formats.append(fmt)
+                tbr = fmt.get('tbr', 0) or 0
+                if best_audio is None or tbr > best_audio_tbr:
+                    best_audio, best_audio_tbr = fmt, tbr
             elif has_video:
-                video_formats.append(fmt)
+                key = (
+                    fmt.get('height', 0) or 0,
+                    fmt.get('width', 0) or 0,
+                    fmt.get('tbr', 0) or 0
+                )
+                if worst_video is None or key < worst_video_key:
+                    worst_video, worst_video_key = fmt, key
+                if has_audio and (worst_progressive is None or key < worst_progressive_key):
+                    worst_progressive, worst_progressive_key = fmt, key
         
         # 优先选择音频格式
-        if audio_only_formats:
-            best_audio = max(audio_only_formats, key=lambda x: x.get('tbr', 0) or 0)
-            logger.info(f"选择音频格式: {best_audio.get('format_id')} ({best_audio.get('ext')})")
+        if best_audio is not None:
+            logger.info("选择音频格式: %s (%s)", best_audio.get('format_id'), best_audio.get('ext'))
             return best_audio.get('format_id', 'bestaudio')
         
-        # 选择最低质量视频
-        if video_formats:
-            video_formats.sort(key=lambda x: (
-                x.get('height', 0) or 0,
-                x.get('width', 0) or 0,
-                x.get('tbr', 0) or 0
-            ))
-            worst_video = video_formats[0]
-            format_selector = worst_video.get('format_id', 'worst')
-            
-            # 如果视频没有音频，添加最佳音频
-            if not (worst_video.get('acodec') and worst_video.get('acodec') != 'none'):
-                format_selector += '+bestaudio'
-            
-            logger.info(f"选择视频格式: {format_selector}")
+        # 优先选择自带音轨的最低质量视频，省去下载后的合并步骤
+        if worst_progressive is not None:
+            format_selector = worst_progressive.get('format_id', 'worst')
+            logger.info("选择视频格式: %s", format_selector)
+            return format_selector
+        
+        # 只有无音轨视频时，选择最低质量视频并合并最佳音频
+        if worst_video is not None:
+            format_selector = worst_video.get('format_id', 'worst') + '+bestaudio'
+            logger.info("选择视频格式: %s", format_selector)
             return format_selector
         
         return 'bestaudio/worst'
     
-    async def download_video(self, url: str, quality: VideoQuality = VideoQuality.WORST) -> str:
-        """下载视频 - 优先Audio Only"""
-        logger.info(f"开始下载视频: {url}")
+    @staticmethod
+    def _find_direct_format(video_info: Dict[str, Any], format_selector: str) -> Optional[Dict[str, Any]]:
+        """选中的是单个可直连的格式时返回该格式，否则返回None（合并/分片/需cookie的交给yt-dlp）"""
+        for fmt in video_info.get('formats') or ():
+            if fmt.get('format_id') == format_selector:
+                if (fmt.get('url') and fmt.get('protocol') in _DIRECT_PROTOCOLS
+                        and not fmt.get('cookies') and not fmt.get('downloader_options')):
+                    return fmt
+                return None
+        return None
+    
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """服务共用的HTTP会话，复用keep-alive连接和DNS缓存（需在事件循环中首次访问）"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=MAX_HTTP_CONNECTIONS,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=DNS_CACHE_TTL,  # CDN域名解析结果缓存，避免每次请求都查询DNS
+                    enable_cleanup_closed=True
+                ),
+                # 请求级timeout会整体替换会话的设置，因此超时全部在此配置，请求处不再单独传入
+                timeout=aiohttp.ClientTimeout(
+                    total=DOWNLOAD_TIMEOUT,
+                    sock_connect=HTTP_CONNECT_TIMEOUT,
+                    sock_read=HTTP_READ_TIMEOUT
+                )
+            )
+        return self._http_session
+    
+    async def aclose(self):
+        """取消预热任务并关闭共用的HTTP会话，服务关闭时调用"""
+        for task in list(self._prewarm_tasks):
+            task.cancel()
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+    
+    async def _download_direct(self, fmt: Dict[str, Any], temp_dir: str) -> str:
+        """直接用aiohttp流式下载媒体文件，不占用线程和yt-dlp进程"""
+        file_path = os.path.join(temp_dir, f"media.{fmt.get('ext') or 'mp4'}")
+        session = self.session
         
-        # 标准化URL（base64解码）
-        normalized_url = self.normalize_input(url)
+        async with session.get(fmt['url'], headers=fmt.get('http_headers')) as response:
+            response.raise_for_status()
+            async with aiofiles.open(file_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DIRECT_CHUNK_SIZE):
+                    await f.write(chunk)
         
-        # 检测平台
-        platform = detect_platform(normalized_url)
-        logger.info(f"检测到平台: {platform}")
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            raise Exception("下载的文件无效或为空")
+        
+        logger.info("直连下载成功: %s (%d bytes)", os.path.basename(file_path), file_size)
+        return file_path
+    
+    async def download_video(self, url: str, quality: VideoQuality = VideoQuality.WORST,
+                             platform: Optional[Platform] = None) -> str:
+        """下载视频 - 优先Audio Only，返回文件路径"""
+        _, file_path = await self.info_and_download(url, quality, platform)
+        return file_path
+    
+    async def info_and_download(self, url: str, quality: VideoQuality = VideoQuality.WORST,
+                                platform: Optional[Platform] = None) -> Tuple[Dict[str, Any], str]:
+        """下载视频并同时返回视频信息（页面只解析一次，下载复用同一份信息）
+        
+        传入platform表示url已经过prepare_input标准化，不再重复处理
+        """
+        logger.info("开始下载视频: %s", url)
+        
+        # 标准化URL（base64解码）并检测平台
+        if platform is None:
+            normalized_url, platform = self.prepare_input(url)
+        else:
+            normalized_url = url
         
         temp_dir = None
         try:
             # 创建临时目录
-            ensure_temp_dir()
-            temp_dir = tempfile.mkdtemp(dir=TEMP_DIR)
+            temp_dir = _make_job_dir()
             
             # 获取视频信息
             video_info = await self.get_video_info(normalized_url)
             
             # 检查是否为直播
-            if video_info.get('live_status') not in [None, 'not_live']:
+            if video_info.get('live_status') not in _NOT_LIVE_STATUSES:
                 raise Exception("不支持直播流下载")
             
             # 选择格式
             format_selector = self.select_best_format(video_info)
             
-            # 执行下载
-            cmd = [
-                'yt-dlp',
+            # 单个HTTP格式直接流式下载，失败再交给yt-dlp
+            direct_format = self._find_direct_format(video_info, format_selector)
+            if direct_format is not None:
+                try:
+                    return video_info, await self._download_direct(direct_format, temp_dir)
+                except Exception as e:
+                    logger.warning("直连下载失败，改用yt-dlp: %s", e)
+                    for name in os.listdir(temp_dir):
+                        os.remove(os.path.join(temp_dir, name))
+            
+            # 执行下载：复用已获取的视频信息，yt-dlp无需再次解析页面
+            info_path = os.path.join(temp_dir, INFO_JSON_NAME)
+            base_cmd = [
+                *_YTDLP_DOWNLOAD_ARGS,
                 '-P', temp_dir,
                 '-f', format_selector,
-                '-o', '%(title).50s.%(ext)s',
-                '--print', 'after_move:filepath',
-                '--no-warnings',
-                normalized_url
+                *_FRAGMENT_ARGS[platform],
+                *self._cookie_args
             ]
+            scratch_dir = _scratch_dir_for(temp_dir)
+            if scratch_dir is not None:
+                base_cmd += ['-P', f'temp:{scratch_dir}']
             
-            # 添加cookie支持
-            cookie_file = "./cookies.txt"
-            if os.path.exists(cookie_file):
-                cmd.extend(['--cookies', cookie_file])
+            logger.info("执行下载: %s", format_selector)
             
-            logger.info(f"执行下载: {format_selector}")
-            
-            def run_download():
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=DOWNLOAD_TIMEOUT,
-                    encoding='utf-8'
-                )
-                
-                if result.returncode != 0:
-                    raise Exception(f"下载失败: {result.stderr}")
-                
-                # 提取文件路径
-                output_lines = result.stdout.strip().split('\n')
-                file_path = None
-                
-                for line in output_lines:
-                    if line.startswith('/') and os.path.exists(line):
-                        file_path = line
-                        break
-                
-                if not file_path:
-                    # 查找下载的文件
-                    files = os.listdir(temp_dir)
-                    media_files = [f for f in files if any(f.lower().endswith(ext) for ext in ALL_MEDIA_EXTENSIONS)]
-                    
-                    if not media_files:
-                        raise Exception("下载完成但未找到媒体文件")
-                    
-                    file_path = os.path.join(temp_dir, media_files[0])
-                
-                # 验证文件
-                if not os.path.exists(file_path) or os.path.getsize(file_path) == 0:
-                    raise Exception("下载的文件无效或为空")
-                
-                logger.info(f"下载成功: {os.path.basename(file_path)} ({os.path.getsize(file_path)} bytes)")
-                return file_path
+            try:
+                try:
+                    file_path = await _download_from_info(
+                        [*base_cmd, '--load-info-json', info_path], temp_dir, video_info, info_path
+                    )
+                except subprocess.TimeoutExpired:
+                    raise
+                except Exception as e:
+                    if _search_definitive_error(str(e)):
+                        raise
+                    # 缓存的直链可能已失效，丢弃缓存后按URL重新解析下载
+                    logger.warning("使用缓存信息下载失败，改为重新解析: %s", e)
+                    self._info_cache.pop(normalized_url, None)
+                    file_path = await _download([*base_cmd, normalized_url], temp_dir)
+            finally:
+                # 中间文件目录只在下载期间使用
+                if scratch_dir is not None:
+                    schedule_cleanup(scratch_dir)
             
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_download)
-                file_path = await asyncio.wrap_future(future)
-                
-            logger.info(f"视频下载成功: {os.path.basename(file_path)}")
-            return file_path
+            logger.info("视频下载成功: %s", os.path.basename(file_path))
+            return video_info, file_path
             
         except Exception as e:
-            logger.error(f"视频下载失败: {e}")
+            logger.error("视频下载失败: %s", e)
             if temp_dir and os.path.exists(temp_dir):
-                cleanup_temp_files(temp_dir)
+                schedule_cleanup(temp_dir)
             raise
     
-    async def get_creator_videos(self, creator_url: str, max_count: int = 20) -> CreatorVideosResponse:
-        """获取创作者视频列表"""
-        logger.info(f"获取创作者视频: {creator_url}")
+    async def download_many(self, urls: List[str], quality: VideoQuality = VideoQuality.WORST) -> List[Any]:
+        """并发下载多个视频，返回文件路径或异常（与urls顺序一致）"""
+        return await asyncio.gather(
+            *[self.download_video(url, quality) for url in urls],
+            return_exceptions=True
+        )
+    
+    async def get_many_creator_videos(self, urls: List[str], max_count: int = 20,
+                                      concurrency: int = 8) -> List[CreatorVideosResponse]:
+        """并发获取多个创作者的视频列表（与urls顺序一致），concurrency限制本批同时进行的数量"""
+        sem = asyncio.Semaphore(concurrency)
         
-        # 标准化URL（base64解码）
-        normalized_url = self.normalize_input(creator_url)
+        async def fetch_one(url: str) -> CreatorVideosResponse:
+            async with sem:
+                return await self.get_creator_videos(url, max_count)
         
-        # 检测平台
-        platform = detect_platform(normalized_url)
-        logger.info(f"检测到平台: {platform}")
+        return await asyncio.gather(*[fetch_one(url) for url in urls])
+    
+    async def get_creator_videos(self, creator_url: str, max_count: int = 20,
+                                 platform: Optional[Platform] = None) -> CreatorVideosResponse:
+        """获取创作者视频列表（传入platform表示creator_url已经过prepare_input标准化）"""
+        logger.info("获取创作者视频: %s", creator_url)
+        
+        # 标准化URL（base64解码）并检测平台
+        if platform is None:
+            normalized_url, platform = self.prepare_input(creator_url)
+        else:
+            normalized_url = creator_url
         
+        # 只缓存成功的结果，错误/空结果下次重新获取
+        return await self._get_cached(
+            self._creator_cache,
+            (normalized_url, max_count),
+            lambda: self._fetch_creator_videos(creator_url, normalized_url, platform, max_count),
+            should_cache=lambda response: response.total_count > 0
+        )
+    
+    async def _fetch_creator_videos(self, creator_url: str, normalized_url: str,
+                                    platform: Platform, max_count: int) -> CreatorVideosResponse:
+        """调用yt-dlp获取创作者视频列表"""
         try:
             cmd = [
-                'yt-dlp',
-                '-J',
-                '--flat-playlist',
+                *_YTDLP_PLAYLIST_ARGS,
                 '-I', f'1-{max_count}',
                 normalized_url
             ]
-            
-            def run_command():
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=90,
-                    encoding='utf-8'
-                )
-                if result.returncode == 0:
-                    return json.loads(result.stdout)
-                else:
-                    logger.error(f"命令失败: {result.stderr}")
-                    return None
-            
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(run_command)
-                try:
-                    info = await asyncio.wait_for(asyncio.wrap_future(future), timeout=120)
-                except asyncio.TimeoutError:
-                    return self._create_error_response(creator_url, "请求超时", platform)
+            try:
+                info = await _extract_playlist(cmd)
+            except subprocess.TimeoutExpired:
+                return self._create_error_response(creator_url, "请求超时", platform)
             
             if not info:
                 return self._create_error_response(creator_url, "无法获取视频列表", platform)
@@ -361,48 +962,40 @@ class VideoService:
             return self._parse_playlist_info(info, creator_url, platform, max_count)
             
         except Exception as e:
-            logger.error(f"获取创作者视频失败: {e}")
+            logger.error("获取创作者视频失败: %s", e)
             return self._create_error_response(creator_url, str(e), platform)
     
     def _parse_playlist_info(self, info: Dict[str, Any], url: str, platform: Platform, max_count: int) -> CreatorVideosResponse:
         """解析播放列表信息"""
-        videos: List[CreatorVideoItem] = []
-        entries = info.get('entries', [])
+        entries = info.get('entries') or []
         
         if not entries:
             return self._create_empty_response(url, platform)
         
         # 创建者信息
-        creator_name = info.get('channel', info.get('uploader', info.get('title', '未知创作者')))
+        creator_name = info.get('channel') or info.get('uploader') or info.get('title') or '未知创作者'
         
-        creator_info = CreatorInfo(
+        # 频道级字段在顶层info中，只取一次
+        creator_info = _make_creator_info(
             name=creator_name,
             platform=platform,
-            profile_url=url
+            profile_url=url,
+            avatar=_creator_avatar(info),
+            description=info.get('description') or None,
+            follower_count=_as_int(info.get('channel_follower_count')),
+            video_count=_as_int(info.get('playlist_count'))
         )
         
-        # 处理视频条目
-        for entry in entries[:max_count]:
-            try:
-                if isinstance(entry, dict):
-                    # 处理嵌套结构（如YouTube）
-                    if entry.get('_type') == 'playlist':
-                        sub_entries = entry.get('entries', [])
-                        for sub_entry in sub_entries[:max_count - len(videos)]:
-                            video_item = self._create_video_item(sub_entry, platform)
-                            if video_item:
-                                videos.append(video_item)
-                    else:
-                        video_item = self._create_video_item(entry, platform)
-                        if video_item:
-                            videos.append(video_item)
-                            
-            except Exception as e:
-                logger.warning(f"处理视频条目失败: {e}")
-                continue
+        # 批量构建视频条目
+        create_item = self._create_video_item
+        videos: List[CreatorVideoItem] = [
+            item
+            for entry in itertools.islice(_iter_entries(entries), max_count)
+            if (item := create_item(entry, platform)) is not None
+        ]
         
-        logger.info(f"成功获取到 {len(videos)} 个视频")
-        return CreatorVideosResponse(
+        logger.info("成功获取到 %d 个视频", len(videos))
+        return _make_videos_response(
             creator_info=creator_info,
             videos=videos,
             total_count=len(videos),
@@ -411,62 +1004,53 @@ class VideoService:
     
     def _create_video_item(self, entry: Dict[str, Any], platform: Platform) -> Optional[CreatorVideoItem]:
         """创建视频项目"""
+        get = entry.get  # 同一条目多次取值，绑定一次方法
         try:
-            video_item = CreatorVideoItem(
-                title=entry.get("title", "未知标题"),
-                url=entry.get("url", ""),
-                thumbnail=None,
-                duration=entry.get("duration") if isinstance(entry.get("duration"), (int, float)) else None,
-                view_count=entry.get("view_count") if isinstance(entry.get("view_count"), (int, float)) else None
+            return _make_video_item(
+                title=get("title") or "未知标题",
+                url=get("url") or get("webpage_url") or "",
+                thumbnail=_first_thumb(entry),
+                duration=_as_int(get("duration")),
+                upload_date=_as_upload_date(entry),
+                view_count=_as_int(get("view_count")),
+                # Bilibili特殊处理
+                bv_id=get("id", "") if platform == Platform.BILIBILI else None
             )
             
-            # 处理缩略图
-            thumbnails = entry.get("thumbnails", [])
-            if thumbnails:
-                for thumb in thumbnails:
-                    if thumb.get("height", 0) >= 120:
-                        video_item.thumbnail = thumb.get("url")
-                        break
-                if not video_item.thumbnail and thumbnails:
-                    video_item.thumbnail = thumbnails[0].get("url")
-            
-            # Bilibili特殊处理
-            if platform == Platform.BILIBILI:
-                video_item.bv_id = entry.get("id", "")
-            
-            return video_item
-            
         except Exception as e:
-            logger.warning(f"创建视频项目失败: {e}")
+            logger.warning("创建视频项目失败: %s", e)
             return None
     
     def _create_empty_response(self, url: str, platform: Platform) -> CreatorVideosResponse:
         """创建空响应"""
-        return CreatorVideosResponse(
-            creator_info=CreatorInfo(
-                name="未知创作者",
-                platform=platform,
-                profile_url=url
-            ),
-            videos=[],
-            total_count=0,
-            has_more=False
-        )
+        template = _EMPTY_RESPONSE_TEMPLATES[platform]
+        return template.model_copy(update={
+            "creator_info": template.creator_info.model_copy(update={"profile_url": url}),
+            "videos": []
+        })
     
     def _create_error_response(self, url: str, error_msg: str, platform: Platform) -> CreatorVideosResponse:
         """创建错误响应"""
-        return CreatorVideosResponse(
-            creator_info=CreatorInfo(
-                name="服务暂不可用",
-                platform=platform,
-                profile_url=url,
-                description=error_msg
+        template = _ERROR_RESPONSE_TEMPLATES[platform]
+        return template.model_copy(update={
+            "creator_info": template.creator_info.model_copy(
+                update={"profile_url": url, "description": error_msg}
             ),
-            videos=[],
-            total_count=0,
-            has_more=False
-        )
+            "videos": []
+        })
 
 
 # 全局实例
 video_service = VideoService()
+
+# 导出绑定方法，调用方可直接导入使用，省去每次经由实例的属性查找
+# （normalize_input本身就是模块级函数）
+prepare_input = video_service.prepare_input
+download_video = video_service.download_video
+download_many = video_service.download_many
+info_and_download = video_service.info_and_download
+get_creator_videos = video_service.get_creator_videos
+get_many_creator_videos = video_service.get_many_creator_videos
+prewarm = video_service.prewarm
+invalidate = video_service.invalidate
+aclose = video_service.aclose